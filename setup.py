@@ -33,6 +33,7 @@ EXTRAS = {
         "pytest",
         "networkx",
         "pytest-cov",
+        "pytest-xdist>=3.2",
     ],
     "cuda": ["jax[cuda]"],
 }
@@ -0,0 +1,29 @@
+# Copyright 2022 The JaxGaussianProcesses Contributors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import os
+
+# Under pytest-xdist every worker starts its own XLA CPU client. When there are
+# at least as many workers as cores, disable XLA's multi-threaded Eigen kernels
+# in each worker so that they do not oversubscribe the cores. With fewer
+# workers, each keeps its Eigen threads to use the spare cores.
+_n_workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "0"))
+if _n_workers >= (os.cpu_count() or 1):
+    os.environ["XLA_FLAGS"] = " ".join(
+        [
+            os.environ.get("XLA_FLAGS", ""),
+            "--xla_cpu_multi_thread_eigen=false",
+        ]
+    ).strip()
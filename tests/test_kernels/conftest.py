@@ -0,0 +1,48 @@
+# Copyright 2022 The JaxGaussianProcesses Contributors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from typing import Tuple
+
+import networkx as nx
+import numpy as np
+import pytest
+from jaxtyping import Float
+
+from gpjax.kernels.non_euclidean import GraphKernel
+
+
+@pytest.fixture(scope="session")
+def graph_laplacian_20_40() -> Tuple[Float[np.ndarray, "N N"], int]:
+    """Laplacian of a random graph with 20 vertices and 40 edges."""
+    n_verticies = 20
+    n_edges = 40
+    G = nx.gnm_random_graph(n_verticies, n_edges, seed=123)
+
+    # Build the Laplacian, L = D - A, directly from the edge list
+    edges = np.array(G.edges())
+    L = np.zeros((n_verticies, n_verticies))
+    L[edges[:, 0], edges[:, 1]] = -1.0
+    L[edges[:, 1], edges[:, 0]] = -1.0
+    L[np.arange(n_verticies), np.arange(n_verticies)] = -L.sum(axis=1)
+    L = L + np.eye(n_verticies) * 1e-12
+    return L, n_verticies
+
+
+@pytest.fixture(scope="session")
+def graph_kernel_20_40(graph_laplacian_20_40) -> GraphKernel:
+    """Graph kernel on the Laplacian above, eigendecomposed once per session."""
+    L, _ = graph_laplacian_20_40
+    return GraphKernel(laplacian=L)
+
@@ -0,0 +1,70 @@
+# Copyright 2022 The JaxGaussianProcesses Contributors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from functools import lru_cache
+from typing import Callable, Dict, Type, Union
+
+import jax
+import jax.random as jr
+import numpy as np
+from jaxtyping import Array, Float
+
+from gpjax.kernels.base import AbstractKernel
+from gpjax.linops import LinearOperator
+
+_initialise_key = jr.PRNGKey(123)
+
+
+@lru_cache(maxsize=None)
+def _default_params(kernel_type: Type[AbstractKernel]) -> Dict:
+    """Default parameters of a kernel class, initialised once per session."""
+    return kernel_type().init_params(_initialise_key)
+
+
+def params_for(kernel_type: Type[AbstractKernel]) -> Dict:
+    """A fresh copy of the cached default parameters of a kernel class, so
+    that callers may modify it without affecting later tests."""
+    return jax.tree_util.tree_map(lambda x: x, _default_params(kernel_type))
+
+
+@lru_cache(maxsize=None)
+def uniform_inputs(n: int, dim: int) -> Float[Array, "N D"]:
+    """Uniformly sampled inputs of shape (n, dim), drawn once per shape."""
+    return jr.uniform(_initialise_key, (n, dim))
+
+
+@lru_cache(maxsize=None)
+def jitted_gram(kernel_type: Type[AbstractKernel], dim: int) -> Callable:
+    """Compiled dense Gram matrix of a kernel class over its first `dim` inputs,
+    traced once per input shape and reused across parameter values."""
+    kernel = kernel_type(active_dims=list(range(dim)))
+    return jax.jit(lambda params, x: kernel.gram(params, x).to_dense())
+
+
+@lru_cache(maxsize=None)
+def jitted_cross_covariance(kernel: AbstractKernel) -> Callable:
+    """Compiled cross-covariance of a kernel, traced once per input shape."""
+    return jax.jit(kernel.cross_covariance)
+
+
+def assert_pos_def(K: Union[LinearOperator, Float[Array, "N N"]]) -> None:
+    """Assert that a Gram matrix is positive definite by factorising it on the
+    host, where a Cholesky decomposition succeeds only for such matrices."""
+    if isinstance(K, LinearOperator):
+        K = K.to_dense()
+    try:
+        np.linalg.cholesky(np.asarray(K))
+    except np.linalg.LinAlgError:
+        raise AssertionError("Gram matrix is not positive definite")
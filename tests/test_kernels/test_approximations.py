@@ -16,6 +16,7 @@ from jax.config import config
 import jax.numpy as jnp
 from gpjax.linops import DenseLinearOperator
 from typing import Tuple
+from tests.test_kernels.helpers import assert_pos_def
 import jax
 
 config.update("jax_enable_x64", True)
@@ -59,8 +60,7 @@ def test_gram(kernel: AbstractKernel, num_basis_fns: int, n_dims: int, n_data: i
     assert Kxx.shape == (n_data, n_data)
 
     # Check that the Gram matrix is PSD
-    evals, _ = jnp.linalg.eigh(Kxx)
-    assert jnp.all(evals > 0)
+    assert_pos_def(Kxx)
 
 
 @pytest.mark.parametrize("kernel", [RBF, Matern12, Matern32, Matern52])
@@ -13,8 +13,10 @@
 # limitations under the License.
 # ==============================================================================
 
+import jax
 import jax.numpy as jnp
 import jax.random as jr
+import numpy as np
 import pytest
 from jax.config import config
 from gpjax.linops import identity
@@ -37,12 +39,50 @@ from jax.random import KeyArray
 from jaxtyping import Array, Float
 from typing import Dict
 
+from tests.test_kernels.helpers import assert_pos_def, params_for
+
 
 # Enable Float64 for more stable matrix inversions.
 config.update("jax_enable_x64", True)
 _initialise_key = jr.PRNGKey(123)
 _jitter = 1e-6
 
+# Evenly spaced inputs shared across the combination kernel tests.
+_x_lin_10 = jnp.linspace(0.0, 1.0, num=10).reshape(-1, 1)
+_x_lin_20 = jnp.linspace(0.0, 1.0, num=20).reshape(-1, 1)
+
+
+# Default kernels whose combinations are checked by value on _x_lin_10.
+_value_kernels = [
+    RBF,
+    Matern12,
+    Matern32,
+    Matern52,
+    Polynomial,
+    Linear,
+    RationalQuadratic,
+]
+
+
+@pytest.fixture(scope="module")
+def value_grams() -> Float[Array, "K N N"]:
+    """Gram matrices of each default kernel on _x_lin_10, computed once."""
+    return jnp.stack(
+        [k().gram(params_for(k), _x_lin_10).to_dense() for k in _value_kernels]
+    )
+
+
+@pytest.fixture(scope="module")
+def sum_grams(value_grams) -> Float[Array, "K K N N"]:
+    """Sums of every pair of default kernel Gram matrices."""
+    return value_grams[:, None] + value_grams[None, :]
+
+
+@pytest.fixture(scope="module")
+def prod_grams(value_grams) -> Float[Array, "K K N N"]:
+    """Products of every pair of default kernel Gram matrices."""
+    return value_grams[:, None] * value_grams[None, :]
+
 
 def test_abstract_kernel():
     # Test initialising abstract kernel raises TypeError with unimplemented __call__ and _init_params methods:
@@ -79,7 +119,7 @@ def test_combination_kernel(
 
     # Create inputs
     n = 20
-    x = jnp.linspace(0.0, 1.0, num=n).reshape(-1, 1)
+    x = _x_lin_20
 
     # Create list of kernels
     kernel_set = [kernel() for _ in range(n_kerns)]
@@ -108,10 +148,20 @@ def test_combination_kernel(
     assert Kxx.shape[0] == Kxx.shape[1]
     assert Kxx.shape[1] == n
 
+    # All kernels share a class, so their gram matrices can instead be computed
+    # in one batched call over stacked parameters and then combined
+    stacked_params = jax.tree_util.tree_map(lambda *p: jnp.stack(p), *params)
+    Kxx_stack = jax.vmap(lambda p: kernel_set[0].gram(p, x).to_dense())(
+        stacked_params
+    )
+    np.testing.assert_allclose(
+        np.asarray(Kxx.to_dense()),
+        np.asarray(combination_kernel.combination_fn(Kxx_stack, axis=0)),
+    )
+
     # Check positive definiteness
     Kxx += identity(n) * _jitter
-    eigen_values = jnp.linalg.eigvalsh(Kxx.to_dense())
-    assert (eigen_values > 0).all()
+    assert_pos_def(Kxx)
 
 
 @pytest.mark.parametrize(
@@ -120,10 +170,11 @@ def test_combination_kernel(
 @pytest.mark.parametrize(
     "k2", [RBF(), Matern12(), Matern32(), Matern52(), Polynomial()]
 )
-def test_sum_kern_value(k1: AbstractKernel, k2: AbstractKernel) -> None:
+def test_sum_kern_value(
+    k1: AbstractKernel, k2: AbstractKernel, sum_grams: Float[Array, "K K N N"]
+) -> None:
     # Create inputs
-    n = 10
-    x = jnp.linspace(0.0, 1.0, num=n).reshape(-1, 1)
+    x = _x_lin_10
 
     # Create sum kernel
     sum_kernel = SumKernel(kernel_set=[k1, k2])
@@ -134,17 +185,15 @@ def test_sum_kern_value(k1: AbstractKernel, k2: AbstractKernel) -> None:
     # Compute gram matrix
     Kxx = sum_kernel.gram(params, x)
 
-    # NOW we do the same thing manually and check they are equal:
-    # Initialise default parameters
-    k1_params = k1.init_params(_initialise_key)
-    k2_params = k2.init_params(_initialise_key)
-
-    # Compute gram matrix
-    Kxx_k1 = k1.gram(k1_params, x)
-    Kxx_k2 = k2.gram(k2_params, x)
-
-    # Check manual and automatic gram matrices are equal
-    assert jnp.all(Kxx.to_dense() == Kxx_k1.to_dense() + Kxx_k2.to_dense())
+    # Check against the manually combined gram matrices
+    i = _value_kernels.index(type(k1))
+    j = _value_kernels.index(type(k2))
+    np.testing.assert_allclose(
+        np.asarray(Kxx.to_dense()),
+        np.asarray(sum_grams[i, j]),
+        rtol=0,
+        atol=0,
+    )
 
 
 @pytest.mark.parametrize(
@@ -173,11 +222,12 @@ def test_sum_kern_value(k1: AbstractKernel, k2: AbstractKernel) -> None:
         RationalQuadratic(),
     ],
 )
-def test_prod_kern_value(k1: AbstractKernel, k2: AbstractKernel) -> None:
+def test_prod_kern_value(
+    k1: AbstractKernel, k2: AbstractKernel, prod_grams: Float[Array, "K K N N"]
+) -> None:
 
     # Create inputs
-    n = 10
-    x = jnp.linspace(0.0, 1.0, num=n).reshape(-1, 1)
+    x = _x_lin_10
 
     # Create product kernel
     prod_kernel = ProductKernel(kernel_set=[k1, k2])
@@ -188,18 +238,15 @@ def test_prod_kern_value(k1: AbstractKernel, k2: AbstractKernel) -> None:
     # Compute gram matrix
     Kxx = prod_kernel.gram(params, x)
 
-    # NOW we do the same thing manually and check they are equal:
-
-    # Initialise default parameters
-    k1_params = k1.init_params(_initialise_key)
-    k2_params = k2.init_params(_initialise_key)
-
-    # Compute gram matrix
-    Kxx_k1 = k1.gram(k1_params, x)
-    Kxx_k2 = k2.gram(k2_params, x)
-
-    # Check manual and automatic gram matrices are equal
-    assert jnp.all(Kxx.to_dense() == Kxx_k1.to_dense() * Kxx_k2.to_dense())
+    # Check against the manually combined gram matrices
+    i = _value_kernels.index(type(k1))
+    j = _value_kernels.index(type(k2))
+    np.testing.assert_allclose(
+        np.asarray(Kxx.to_dense()),
+        np.asarray(prod_grams[i, j]),
+        rtol=0,
+        atol=0,
+    )
 
 
 @pytest.mark.parametrize(
@@ -16,10 +16,12 @@
 import jax.numpy as jnp
 import jax.random as jr
 import networkx as nx
+import numpy as np
 from jax.config import config
 from gpjax.linops import identity
 
 from gpjax.kernels.non_euclidean import GraphKernel
+from tests.test_kernels.helpers import assert_pos_def
 
 # Enable Float64 for more stable matrix inversions.
 config.update("jax_enable_x64", True)
@@ -27,18 +29,21 @@ _initialise_key = jr.PRNGKey(123)
 _jitter = 1e-6
 
 
-def test_graph_kernel():
-    # Create a random graph, G, and verice labels, x,
-    n_verticies = 20
-    n_edges = 40
-    G = nx.gnm_random_graph(n_verticies, n_edges, seed=123)
-    x = jnp.arange(n_verticies).reshape(-1, 1)
+def test_graph_laplacian_matches_networkx(graph_laplacian_20_40):
+    # The edge-list Laplacian matches networkx's, up to the same regulariser
+    L, n_verticies = graph_laplacian_20_40
+    G = nx.gnm_random_graph(n_verticies, 40, seed=123)
+    L_nx = nx.laplacian_matrix(G).toarray() + np.eye(n_verticies) * 1e-12
+    np.testing.assert_array_equal(L, L_nx)
+
 
-    # Compute graph laplacian
-    L = nx.laplacian_matrix(G).toarray() + jnp.eye(n_verticies) * 1e-12
+def test_graph_kernel(graph_laplacian_20_40, graph_kernel_20_40):
+    # Vertex labels, x, of a random graph with a precomputed Laplacian
+    _, n_verticies = graph_laplacian_20_40
+    x = jnp.arange(n_verticies).reshape(-1, 1)
 
-    # Create graph kernel
-    kern = GraphKernel(laplacian=L)
+    # Graph kernel, shared across the test session
+    kern = graph_kernel_20_40
     assert isinstance(kern, GraphKernel)
     assert kern.num_vertex == n_verticies
     assert kern.evals.shape == (n_verticies, 1)
@@ -62,5 +67,4 @@ def test_graph_kernel():
 
     # Check positive definiteness
     Kxx += identity(n_verticies) * _jitter
-    eigen_values = jnp.linalg.eigvalsh(Kxx.to_dense())
-    assert all(eigen_values > 0)
+    assert_pos_def(Kxx)
@@ -14,15 +14,18 @@
 # ==============================================================================
 
 
+from functools import lru_cache
 from itertools import permutations
+from typing import Dict
 
 import jax
 import jax.numpy as jnp
 import jax.random as jr
+import numpy as np
 import pytest
 import distrax as dx
 from jax.config import config
-from gpjax.linops import LinearOperator, identity
+from gpjax.linops import DenseLinearOperator, LinearOperator, identity
 from jaxutils.parameters import initialise
 
 from gpjax.kernels.base import AbstractKernel
@@ -37,6 +40,13 @@ from gpjax.kernels.stationary import (
     White,
 )
 from gpjax.kernels.stationary.utils import build_student_t_distribution
+from tests.test_kernels.helpers import (
+    assert_pos_def,
+    jitted_cross_covariance,
+    jitted_gram,
+    params_for,
+    uniform_inputs,
+)
 
 # Enable Float64 for more stable matrix inversions.
 config.update("jax_enable_x64", True)
@@ -44,6 +54,12 @@ _initialise_key = jr.PRNGKey(123)
 _jitter = 1e-6
 
 
+@lru_cache(maxsize=None)
+def _stationary_params(ell: float, sigma: float) -> Dict:
+    """Lengthscale and variance parameters, built once per value pair."""
+    return {"lengthscale": jnp.array([ell]), "variance": jnp.array([sigma])}
+
+
 @pytest.mark.parametrize(
     "kernel",
     [
@@ -66,7 +82,7 @@ def test_gram(kernel: AbstractKernel, dim: int, n: int) -> None:
     x = jnp.linspace(0.0, 1.0, n * dim).reshape(n, dim)
 
     # Default kernel parameters:
-    params = kernel.init_params(_initialise_key)
+    params = params_for(type(kernel))
 
     # Test gram matrix:
     Kxx = kernel.gram(params, x)
@@ -96,10 +112,10 @@ def test_cross_covariance(
     b = jnp.linspace(3.0, 4.0, num_b * dim).reshape(num_b, dim)
 
     # Default kernel parameters:
-    params = kernel.init_params(_initialise_key)
+    params = params_for(type(kernel))
 
     # Test cross covariance, Kab:
-    Kab = kernel.cross_covariance(params, a, b)
+    Kab = jitted_cross_covariance(kernel)(params, a, b)
     assert isinstance(Kab, jnp.ndarray)
     assert Kab.shape == (num_a, num_b)
 
@@ -113,7 +129,7 @@ def test_call(kernel: AbstractKernel, dim: int) -> None:
     y = jnp.array([[0.5] * dim])
 
     # Defualt parameters:
-    params = kernel.init_params(_initialise_key)
+    params = params_for(type(kernel))
 
     # Test calling gives an autocovariance value of no dimension between the inputs:
     kxy = kernel(params, x, y)
@@ -129,17 +145,14 @@ def test_call(kernel: AbstractKernel, dim: int) -> None:
 def test_pos_def(
     kern: AbstractKernel, dim: int, ell: float, sigma: float, n: int
 ) -> None:
-    kern = kern(active_dims=list(range(dim)))
-
     # Create inputs x:
-    x = jr.uniform(_initialise_key, (n, dim))
-    params = {"lengthscale": jnp.array([ell]), "variance": jnp.array([sigma])}
+    x = uniform_inputs(n, dim)
+    params = _stationary_params(ell, sigma)
 
-    # Test gram matrix eigenvalues are positive:
-    Kxx = kern.gram(params, x)
+    # Test gram matrix is positive definite:
+    Kxx = DenseLinearOperator(jitted_gram(kern, dim)(params, x))
     Kxx += identity(n) * _jitter
-    eigen_values = jnp.linalg.eigvalsh(Kxx.to_dense())
-    assert (eigen_values > 0.0).all()
+    assert_pos_def(Kxx)
 
 
 @pytest.mark.parametrize("dim", [1, 2, 5])
@@ -147,23 +160,14 @@ def test_pos_def(
 @pytest.mark.parametrize("alpha", [0.1, 0.5, 1.0])
 @pytest.mark.parametrize("n", [1, 2, 5])
 def test_pos_def_rq(dim: int, ell: float, sigma: float, alpha: float, n: int) -> None:
-    kern = RationalQuadratic(active_dims=list(range(dim)))
-    # Gram constructor static method:
-    kern.gram
-
     # Create inputs x:
-    x = jr.uniform(_initialise_key, (n, dim))
-    params = {
-        "lengthscale": jnp.array([ell]),
-        "variance": jnp.array([sigma]),
-        "alpha": jnp.array([alpha]),
-    }
-
-    # Test gram matrix eigenvalues are positive:
-    Kxx = kern.gram(params, x)
+    x = uniform_inputs(n, dim)
+    params = {**_stationary_params(ell, sigma), "alpha": jnp.array([alpha])}
+
+    # Test gram matrix is positive definite:
+    Kxx = DenseLinearOperator(jitted_gram(RationalQuadratic, dim)(params, x))
     Kxx += identity(n) * _jitter
-    eigen_values = jnp.linalg.eigvalsh(Kxx.to_dense())
-    assert (eigen_values > 0.0).all()
+    assert_pos_def(Kxx)
 
 
 @pytest.mark.parametrize("dim", [1, 2, 5])
@@ -173,23 +177,14 @@ def test_pos_def_rq(dim: int, ell: float, sigma: float, alpha: float, n: int) ->
 def test_pos_def_periodic(
     dim: int, ell: float, sigma: float, period: float, n: int
 ) -> None:
-    kern = Periodic(active_dims=list(range(dim)))
-    # Gram constructor static method:
-    kern.gram
-
     # Create inputs x:
-    x = jr.uniform(_initialise_key, (n, dim))
-    params = {
-        "lengthscale": jnp.array([ell]),
-        "variance": jnp.array([sigma]),
-        "period": jnp.array([period]),
-    }
-
-    # Test gram matrix eigenvalues are positive:
-    Kxx = kern.gram(params, x)
+    x = uniform_inputs(n, dim)
+    params = {**_stationary_params(ell, sigma), "period": jnp.array([period])}
+
+    # Test gram matrix is positive definite:
+    Kxx = DenseLinearOperator(jitted_gram(Periodic, dim)(params, x))
     Kxx += identity(n) * _jitter
-    eigen_values = jnp.linalg.eigvalsh(Kxx.to_dense())
-    assert (eigen_values > 0.0).all()
+    assert_pos_def(Kxx)
 
 
 @pytest.mark.parametrize("dim", [1, 2, 5])
@@ -199,23 +194,14 @@ def test_pos_def_periodic(
 def test_pos_def_power_exp(
     dim: int, ell: float, sigma: float, power: float, n: int
 ) -> None:
-    kern = PoweredExponential(active_dims=list(range(dim)))
-    # Gram constructor static method:
-    kern.gram
-
     # Create inputs x:
-    x = jr.uniform(_initialise_key, (n, dim))
-    params = {
-        "lengthscale": jnp.array([ell]),
-        "variance": jnp.array([sigma]),
-        "power": jnp.array([power]),
-    }
-
-    # Test gram matrix eigenvalues are positive:
-    Kxx = kern.gram(params, x)
+    x = uniform_inputs(n, dim)
+    params = {**_stationary_params(ell, sigma), "power": jnp.array([power])}
+
+    # Test gram matrix is positive definite:
+    Kxx = DenseLinearOperator(jitted_gram(PoweredExponential, dim)(params, x))
     Kxx += identity(n) * _jitter
-    eigen_values = jnp.linalg.eigvalsh(Kxx.to_dense())
-    assert (eigen_values > 0.0).all()
+    assert_pos_def(Kxx)
 
 
 @pytest.mark.parametrize("kernel", [RBF, Matern12, Matern32, Matern52])
@@ -273,24 +259,33 @@ def test_active_dim(kernel: AbstractKernel) -> None:
     # Generate random inputs
     x = jr.normal(_initialise_key, shape=(20, n_dims))
 
-    for dp in dim_pairs:
-        # Take slice of x
-        slice = x[..., dp]
-
-        # Define kernels
-        ad_kern = kernel(active_dims=dp)
-        manual_kern = kernel(active_dims=[i for i in range(perm_length)])
-
-        # Get initial parameters
-        ad_params = ad_kern.init_params(_initialise_key)
-        manual_params = manual_kern.init_params(_initialise_key)
-
-        # Compute gram matrices
-        ad_Kxx = ad_kern.gram(ad_params, x)
-        manual_Kxx = manual_kern.gram(manual_params, slice)
-
-        # Test gram matrices are equal
-        assert jnp.all(ad_Kxx.to_dense() == manual_Kxx.to_dense())
+    # Both kernels act on two dimensions, so share the same parameters:
+    manual_kern = kernel(active_dims=[i for i in range(perm_length)])
+    params = manual_kern.init_params(_initialise_key)
+
+    # Gram matrices of kernels acting on each pair of active dimensions. The
+    # pairs are static, so the loop is unrolled into a single compiled call:
+    stacked_gram = jax.jit(
+        lambda x: jnp.stack(
+            [
+                kernel(active_dims=dp).gram(params, x).to_dense()
+                for dp in dim_pairs
+            ]
+        )
+    )
+    ad_Kxx = stacked_gram(x)
+
+    # Gram matrices of the manual kernel on each slice of x, computed in a
+    # single batched call:
+    batched_gram = jax.jit(
+        jax.vmap(lambda dp: manual_kern.gram(params, x[..., dp]).to_dense())
+    )
+    manual_Kxx = batched_gram(jnp.array(dim_pairs))
+
+    # Test gram matrices are equal
+    np.testing.assert_allclose(
+        np.asarray(ad_Kxx), np.asarray(manual_Kxx), rtol=0, atol=1e-12
+    )
 
 
 @pytest.mark.parametrize("smoothness", [1, 2, 3])
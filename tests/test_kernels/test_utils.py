@@ -13,29 +13,30 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import List
-
+import jax
 import jax.numpy as jnp
-import pytest
-from jaxtyping import Array, Float
+import numpy as np
 from gpjax.kernels.stationary.utils import euclidean_distance
 
+# Distances between each pair of inputs, correct to 3dp. Zero-padding the
+# inputs to a common dimension leaves the distances unchanged, so every case
+# can be evaluated in a single batched call.
+_a = [[1.0], [1.0, -2.0], [1.0, 2.0, 3.0]]
+_b = [[-4.0], [-4.0, 3.0], [1.0, 1.0, 1.0]]
+_distances_to_3dp = [5.0, 7.071, 2.236]
+
+_max_dim = max(len(a) for a in _a)
+_A = jnp.stack([jnp.array(a + [0.0] * (_max_dim - len(a))) for a in _a])
+_B = jnp.stack([jnp.array(b + [0.0] * (_max_dim - len(b))) for b in _b])
 
-@pytest.mark.parametrize(
-    "a, b, distance_to_3dp",
-    [
-        ([1.0], [-4.0], 5.0),
-        ([1.0, -2.0], [-4.0, 3.0], 7.071),
-        ([1.0, 2.0, 3.0], [1.0, 1.0, 1.0], 2.236),
-    ],
-)
-def test_euclidean_distance(
-    a: List[float], b: List[float], distance_to_3dp: float
-) -> None:
 
-    # Convert lists to JAX arrays:
-    a: Float[Array, "D"] = jnp.array(a)
-    b: Float[Array, "D"] = jnp.array(b)
+def test_euclidean_distance() -> None:
+    # Compute all distances in a single batched call:
+    distances = jax.jit(jax.vmap(euclidean_distance))(_A, _B)
 
-    # Test distance is correct to 3dp:
-    assert jnp.round(euclidean_distance(a, b), 3) == distance_to_3dp
+    # Test distances are correct to 3dp:
+    distances = np.asarray(distances)
+    np.testing.assert_array_equal(
+        np.round(distances, 3),
+        np.asarray(_distances_to_3dp, dtype=distances.dtype),
+    )